@@ -20,7 +20,6 @@ from game_stats import GameStats
 from alien_fleet import AlienFleet
 from button import Button
 from hud import HUD
-from time import sleep
 
 class AlienInvasion:
     """
@@ -44,7 +43,7 @@ class AlienInvasion:
         pygame.display.set_caption(self.settings.name)
 
         self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg, (self.settings.screen_w, self.settings.screen_h))
+        self.bg = pygame.transform.scale(self.bg, (self.settings.screen_w, self.settings.screen_h)).convert()
 
         self.game_stats = GameStats(self)
         self.HUD = HUD(self)
@@ -60,24 +59,29 @@ class AlienInvasion:
 
         self.ship = Ship(self, Arsenal(self))
         self.alien_fleet = AlienFleet(self)
-        self.alien_fleet.create_fleet()
 
         self.play_button = Button(self, 'Play')
         self.game_active = False
+        self._pause_frames = 0
+        self._full_redraw = True
 
     def run_game(self):
         """
         Run the main game loop.
         
         Continuously checks for events, updates game objects when active, checks for
-        collisions, and updates the display at the specified FPS rate. Runs until
-        the game is terminated by the player.
+        collisions, and updates the display at the specified FPS rate. While a
+        pause is counting down, events and drawing continue but game objects are
+        not updated. Runs until the game is terminated by the player.
         """
         #Game Loop
         while self.running:
             self._check_events()
-            if self.game_active:
-                self.ship.update()
+            if self._pause_frames > 0:
+                self._pause_frames -= 1
+            elif self.game_active:
+                keys = pygame.key.get_pressed()
+                self.ship.update(keys)
                 self.alien_fleet.update_fleet()
                 self._check_collisions()
             self._update_screen()
@@ -116,26 +120,29 @@ class AlienInvasion:
         """
         Check and update the game status after a collision.
         
-        Decrements the ship count if ships remain, resets the level, and pauses briefly.
-        If no ships remain, ends the game by setting game_active to False.
+        Decrements the ship count if ships remain, resets the level, and pauses for
+        half a second worth of frames. If no ships remain, ends the game by setting
+        game_active to False.
         """
         if self.game_stats.ships_left > 0:
             self.game_stats.ships_left -= 1
             self._reset_level()
-            sleep(0.5)
+            self._pause_frames = int(0.5 * self.settings.FPS)
         else:
             self.game_active = False
+            self._full_redraw = True
 
     def _reset_level(self):
         """
         Reset the current level.
         
         Clears all projectiles and aliens from the screen, then creates a new alien fleet
-        to prepare for the next wave of enemies.
+        to prepare for the next wave of enemies. The next frame redraws the full screen.
         """
-        self.ship.arsenal.arsenal.empty()
-        self.alien_fleet.fleet.empty()
+        self.ship.arsenal.clear_arsenal()
+        self.alien_fleet.clear_fleet()
         self.alien_fleet.create_fleet()
+        self._full_redraw = True
 
     def restart_game(self):
         """
@@ -150,6 +157,7 @@ class AlienInvasion:
         self.HUD.update_scores()
         self._reset_level()
         self.ship._center_ship()
+        self._pause_frames = 0
         self.game_active = True
         pygame.mouse.set_visible(False)
 
@@ -158,19 +166,31 @@ class AlienInvasion:
         Update the game display.
         
         Draws the background, ship, aliens, and HUD to the screen. Displays the
-        play button when the game is inactive, and updates the display with all
-        rendered elements.
+        play button when the game is inactive. Normally only the areas drawn last
+        frame are restored from the background and only the changed areas are sent
+        to the display; after a level reset or game over the whole screen is
+        redrawn and flipped.
         """
-        self.screen.blit(self.bg, (0,0))
-        self.ship.draw()
-        self.alien_fleet.draw()
-        self.HUD.draw()
+        if self._full_redraw:
+            self.screen.blit(self.bg, (0,0))
+        else:
+            self.ship.clear(self.bg)
+            self.alien_fleet.clear(self.bg)
+            self.HUD.clear(self.bg)
+
+        dirty = self.ship.draw()
+        dirty += self.alien_fleet.draw()
+        dirty += self.HUD.draw()
 
         if not self.game_active:
-            self.play_button.draw()
+            dirty.append(self.play_button.draw())
             pygame.mouse.set_visible(True)
 
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(dirty)
 
     def _check_events(self):
         """
@@ -207,17 +227,13 @@ class AlienInvasion:
         """
         Handle key release events.
         
-        Processes key up events for ship movement (UP/DOWN arrows), quit command (Q),
-        and stops the corresponding movement flags when keys are released.
+        Processes the quit command (Q). Ship movement reads the held arrow keys
+        directly each frame, so releasing them needs no handling here.
         
         Args:
             event: The pygame key up event containing the key information.
         """
-        if event.key == pygame.K_UP:
-            self.ship.moving_up = False
-        elif event.key == pygame.K_DOWN:
-            self.ship.moving_down = False
-        elif event.key == pygame.K_q:
+        if event.key == pygame.K_q:
             self.running = False
             pygame.quit()
             sys.exit()
@@ -226,18 +242,13 @@ class AlienInvasion:
         """
         Handle key press events.
         
-        Processes key down events for ship movement (UP/DOWN arrows), firing projectiles
-        (SPACE), and quit command (Q). Plays laser sound when firing and saves scores
-        when quitting.
+        Processes key down events for firing projectiles (SPACE) and the quit
+        command (Q). Plays laser sound when firing and saves scores when quitting.
         
         Args:
             event: The pygame key down event containing the key information.
         """
-        if event.key == pygame.K_UP:
-            self.ship.moving_up = True
-        elif event.key == pygame.K_DOWN:
-            self.ship.moving_down = True
-        elif event.key == pygame.K_SPACE:
+        if event.key == pygame.K_SPACE:
             if self.ship.fire():
                 self.laser_sound.play()
                 self.laser_sound.fadeout(250)
@@ -5,9 +5,11 @@ Author: Christopher Orta
 Date: 11/24/2025
 
 Purpose: Manage a grid of `Alien` sprites, including creation, movement,
-edge detection, collision checks, and rendering.
+edge detection, collision checks, and rendering. Alien positions are kept in
+NumPy arrays so the whole fleet moves in a single vectorized step.
 """
 
+import numpy as np
 import pygame
 from alien import Alien
 from typing import TYPE_CHECKING
@@ -27,14 +29,23 @@ class AlienFleet:
         """Initialize fleet-related attributes and create the initial fleet."""
         self.game = game
         self.settings = game.settings
-        self.fleet = pygame.sprite.Group()
+        self.fleet = pygame.sprite.RenderUpdates()
         self.fleet_direction = self.settings.fleet_direction
         self.fleet_drop_speed = self.settings.fleet_drop_speed
+        self._row_buckets: dict[int, list[Alien]] = {}
+        self._alien_list: list[Alien] = []
+        self._alien_pool: list[Alien] = []
+        self._xs = np.empty(0, dtype=np.float32)
+        self._ys = np.empty(0, dtype=np.float32)
+        self._fleet_y_min = 0
+        self._fleet_y_max = 0
+        self._fleet_x_max = 0
+        self._spawn_positions = self._calculate_spawn_positions()
 
         self.create_fleet()
 
-    def create_fleet(self):
-        """Compute offsets and create the rectangular fleet of aliens."""
+    def _calculate_spawn_positions(self):
+        """Compute offsets and return the (x, y) spawn point of every alien."""
         alien_h = self.settings.alien_h
         alien_w = self.settings.alien_w
         screen_h = self.settings.screen_h
@@ -44,10 +55,45 @@ class AlienFleet:
         x_offset, y_offset = self.calculate_offsets(
             alien_h, fleet_h, alien_w, fleet_w, screen_h, screen_w
         )
-        self._create_rectangle_fleet(
+        return self._calculate_rectangle_positions(
             fleet_w, fleet_h, alien_w, alien_h, x_offset, y_offset
         )
 
+    def clear_fleet(self):
+        """Remove every alien from the fleet, keeping them for reuse."""
+        self._alien_pool.extend(self._alien_list)
+        self._alien_list = []
+        self.fleet.empty()
+
+    def create_fleet(self):
+        """Create the rectangular fleet of aliens at the cached spawn points."""
+        for x, y in self._spawn_positions:
+            self._create_alien(x, y)
+        self._load_positions()
+        self._update_fleet_bounds()
+        self._rebuild_row_buckets()
+
+    def _load_positions(self):
+        """Copy the fleet's alien positions into the x/y position arrays."""
+        self._alien_list = list(self.fleet)
+        count = len(self._alien_list)
+        self._xs = np.fromiter((alien.rect.x for alien in self._alien_list),
+            dtype=np.float32, count=count)
+        self._ys = np.fromiter((alien.rect.y for alien in self._alien_list),
+            dtype=np.float32, count=count)
+
+    def _prune_positions(self):
+        """Drop the positions of aliens that were removed from the fleet."""
+        if len(self._alien_list) == len(self.fleet):
+            return
+        alive = np.fromiter((alien.alive() for alien in self._alien_list),
+            dtype=bool, count=len(self._alien_list))
+        self._alien_pool.extend(
+            alien for alien, keep in zip(self._alien_list, alive) if not keep)
+        self._alien_list = [alien for alien, keep in zip(self._alien_list, alive) if keep]
+        self._xs = self._xs[alive]
+        self._ys = self._ys[alive]
+
     def calculate_fleet_size(self, alien_h, screen_h, alien_w, screen_w):
         """Return the number of rows and columns for the fleet layout."""
         fleet_h = (screen_h // alien_h)
@@ -76,63 +122,127 @@ class AlienFleet:
 
         return x_offset, y_offset
 
-    def _create_rectangle_fleet(
+    def _calculate_rectangle_positions(
         self, fleet_w: int, fleet_h: int, alien_w: int, alien_h: int, x_offset: int, y_offset: int
-    ):
-        """Populate the fleet group with aliens arranged in a rectangle."""
-        for col in range(fleet_w):
-            for row in range(fleet_h):
-                current_y = alien_h * row + y_offset
-                current_x = alien_w * col + x_offset
-                if row % 2 == 0 or col % 2 == 0:
-                    continue
-                self._create_alien(current_y, current_x)
+    ) -> list[tuple[int, int]]:
+        """Return spawn points for aliens arranged in a rectangle.
+
+        Aliens occupy only the odd rows and columns of the grid, leaving a gap
+        of one alien between neighbors.
+        """
+        positions = []
+        for col in range(1, fleet_w, 2):
+            current_x = alien_w * col + x_offset
+            current_y = alien_h + y_offset
+            for _ in range(1, fleet_h, 2):
+                positions.append((current_x, current_y))
+                current_y += 2 * alien_h
+        return positions
 
     def _create_alien(self, current_x: int, current_y: int):
-        """Create a single Alien and add it to the fleet group."""
-        new_alien = Alien(self, current_y, current_x)
+        """Add an Alien to the fleet group, reusing a pooled one if available."""
+        if self._alien_pool:
+            new_alien = self._alien_pool.pop()
+            new_alien.rect.topleft = (current_x, current_y)
+        else:
+            new_alien = Alien(self, current_x, current_y)
 
         self.fleet.add(new_alien)
 
     def _check_fleet_edges(self):
         """Check whether any alien reached vertical screen edges and respond."""
-        alien: Alien
-        for alien in self.fleet:
-            if alien.check_edges():
-                self._drop_alien_fleet()
-                self.fleet_direction *= -1
-                break
+        top = 0
+        bottom = self.settings.screen_h - self.settings.alien_h
+        # Round the way pygame rounds rect coordinates (halves away from zero),
+        # so the check sees the positions the rects were drawn at.
+        ys = np.floor(self._ys + 0.5)
+        if (ys >= bottom).any() or (ys <= top).any():
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
 
     def _drop_alien_fleet(self):
         """Move the fleet back toward the left by the configured drop speed."""
-        for alien in self.fleet:
-            alien.x -= self.fleet_drop_speed
+        self._xs -= np.float32(self.fleet_drop_speed)
+        for alien, x in zip(self._alien_list, self._xs.tolist()):
+            alien.rect.x = x
 
     def update_fleet(self):
         """Perform per-frame fleet updates: edge checks and movement."""
+        self._prune_positions()
         self._check_fleet_edges()
-        self.fleet.update()
+        self._ys += np.float32(self.settings.fleet_speed * self.fleet_direction)
+        for alien, y in zip(self._alien_list, self._ys.tolist()):
+            alien.rect.y = y
+        self._update_fleet_bounds()
+        self._rebuild_row_buckets()
+
+    def _update_fleet_bounds(self):
+        """Record the top, bottom, and right edges of the whole fleet."""
+        if not self._alien_list:
+            self._fleet_y_min = self._fleet_y_max = self._fleet_x_max = 0
+            return
+        # Round halves away from zero, as pygame does for rect coordinates.
+        ys = np.floor(self._ys + 0.5)
+        xs = np.floor(self._xs + 0.5)
+        self._fleet_y_min = int(ys.min())
+        self._fleet_y_max = int(ys.max()) + self.settings.alien_h
+        self._fleet_x_max = int(xs.max()) + self.settings.alien_w
+
+    def _rebuild_row_buckets(self):
+        """Bucket the aliens by row (`rect.y // alien_h`) for collision lookups."""
+        cell_h = self.settings.alien_h
+        buckets: dict[int, list[Alien]] = {}
+        for alien in self.fleet:
+            buckets.setdefault(alien.rect.y // cell_h, []).append(alien)
+        self._row_buckets = buckets
+
+    def clear(self, bg):
+        """Erase the aliens drawn last frame by blitting `bg` over them."""
+        self.fleet.clear(self.game.screen, bg)
 
     def draw(self):
-        """Draw all aliens in the fleet to the screen."""
-        alien: 'Alien'
-        for alien in self.fleet:
-            alien.draw_alien()
+        """Draw all aliens in the fleet and return the changed screen areas."""
+        return self.fleet.draw(self.game.screen)
 
     def check_collisions(self, other_group):
         """Check for collisions between aliens and another sprite group.
 
-        Returns a mapping of collisions as `pygame.sprite.groupcollide` provides.
+        Sprites outside the fleet's vertical band, or already past its right
+        edge, are skipped. For the rest only aliens in the row buckets the
+        sprite overlaps are tested, so the check is O(N + M) instead of testing
+        every (alien, sprite) pair.
+        Colliding aliens and sprites are killed. Returns a mapping of collisions
+        in the same shape `pygame.sprite.groupcollide` provides.
         """
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)
+        cell_h = self.settings.alien_h
+        y_min, y_max, x_max = self._fleet_y_min, self._fleet_y_max, self._fleet_x_max
+        candidates = [sprite for sprite in other_group
+            if y_min < sprite.rect.bottom and sprite.rect.top < y_max
+            and sprite.rect.left < x_max]
+        collisions = {}
+        get_row = self._row_buckets.get
+        empty = ()
+        for sprite in candidates:
+            colliderect = sprite.rect.colliderect
+            hit = None
+            for row in range(sprite.rect.top // cell_h - 1, (sprite.rect.bottom - 1) // cell_h + 1):
+                for alien in get_row(row, empty):
+                    if colliderect(alien.rect):
+                        hit = alien
+                        break
+                if hit is not None:
+                    collisions.setdefault(hit, []).append(sprite)
+                    break
+
+        for alien, sprites in collisions.items():
+            alien.kill()
+            for sprite in sprites:
+                sprite.kill()
+        return collisions
 
     def check_fleet_left(self):
         """Return True if any alien has moved entirely off the left side of screen."""
-        alien: Alien
-        for alien in self.fleet:
-            if alien.rect.right < 0:
-                return True
-        return False
+        return any(alien.rect.right < 0 for alien in self.fleet)
 
     def check_destroyed_status(self):
         """Return True when the fleet is empty (all aliens destroyed)."""
@@ -5,7 +5,7 @@ Author: Christopher Orta
 Date: 11/24/2025
 
 Purpose: Manage a group of `Bullet` sprites fired by the player's ship.
-Provides update, rendering, off-screen removal, and firing logic.
+Provides update, rendering, and firing logic.
 """
 
 from bullet import Bullet
@@ -23,31 +23,49 @@ class Arsenal:
         """Create an empty `arsenal` group associated with the game."""
         self.game = game
         self.settings = game.settings
-        self.arsenal = pygame.sprite.Group()
+        self.arsenal = pygame.sprite.RenderUpdates()
+        self._bullet_list: list[Bullet] = []
+        self._bullet_pool: list[Bullet] = []
 
     def update_arsenal(self):
-        """Update bullets and remove any that moved off-screen."""
+        """Update bullets; bullets that move off-screen remove themselves."""
+        self._prune_bullets()
         self.arsenal.update()
-        self._remove_bullets_offscreen()
 
-    def _remove_bullets_offscreen(self):
-        """Remove bullets whose right edge passed the screen boundary."""
-        for bullet in self.arsenal.copy():
-            if bullet.rect.right >= self.settings.screen_w + 80:
-                self.arsenal.remove(bullet)
+    def _prune_bullets(self):
+        """Move bullets that were removed from the arsenal into the pool."""
+        if len(self._bullet_list) == len(self.arsenal):
+            return
+        self._bullet_pool.extend(bullet for bullet in self._bullet_list if not bullet.alive())
+        self._bullet_list = [bullet for bullet in self._bullet_list if bullet.alive()]
+
+    def clear_arsenal(self):
+        """Remove every bullet from the arsenal, keeping them for reuse."""
+        self._bullet_pool.extend(self._bullet_list)
+        self._bullet_list = []
+        self.arsenal.empty()
+
+    def clear(self, bg):
+        """Erase the bullets drawn last frame by blitting `bg` over them."""
+        self.arsenal.clear(self.game.screen, bg)
 
     def draw(self):
-        """Draw all bullets in the arsenal to the screen."""
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
+        """Draw all bullets in the arsenal and return the changed screen areas."""
+        return self.arsenal.draw(self.game.screen)
     
     def fire_bullet(self):
         """Attempt to fire a new bullet if under the allowed bullet limit.
 
-        Returns True when a bullet is created, False if the cap prevents firing.
+        Pooled bullets are reused before a new one is created. Returns True when
+        a bullet is fired, False if the cap prevents firing.
         """
         if len(self.arsenal) < self.settings.bullet_amount:
-            new_bullet = Bullet(self.game)
+            if self._bullet_pool:
+                new_bullet = self._bullet_pool.pop()
+                new_bullet.reset()
+            else:
+                new_bullet = Bullet(self.game)
+            self._bullet_list.append(new_bullet)
             self.arsenal.add(new_bullet)
             return True
         return False
\ No newline at end of file
@@ -5,7 +5,7 @@ Author: Christopher Orta
 Date: 11/24/2025
 
 Purpose: Define the `Bullet` sprite used by the player's ship. Bullets
-move horizontally across the screen and render themselves.
+move horizontally across the screen and are drawn by the arsenal's group.
 """
 
 import pygame
@@ -20,27 +20,33 @@ class Bullet(Sprite):
     """Projectile fired by the player's ship.
 
     The `Bullet` class extends `pygame.sprite.Sprite` and manages its
-    position, movement, and rendering.
+    position and movement.
     """
     def __init__(self, game: 'AlienInvasion'):
         """Create a new bullet positioned at the ship's mid-left point."""
         super().__init__()
-        self.screen = game.screen
         self.settings = game.settings
+        self.ship = game.ship
 
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.bullet_w, self.settings.bullet_h))
-        self.image = pygame.transform.rotate(self.image, -90)
+        if self.settings.bullet_surface is None:
+            image = pygame.image.load(self.settings.bullet_file)
+            image = pygame.transform.scale(image, (self.settings.bullet_w, self.settings.bullet_h))
+            image = pygame.transform.rotate(image, -90)
+            self.settings.bullet_surface = image.convert_alpha()
+        self.image = self.settings.bullet_surface
 
         self.rect = self.image.get_rect()
-        self.rect.midleft = game.ship.rect.midleft
+        self._death_x = self.settings.screen_w + 80 - self.rect.width
+        self.reset()
+
+    def reset(self):
+        """Position the bullet at the ship's mid-left point."""
+        self.rect.midleft = self.ship.rect.midleft
         self.x = float(self.rect.x)
 
     def update(self):
-        """Move the bullet to the right each frame by its speed."""
+        """Move the bullet right by its speed and kill it once off-screen."""
         self.x += self.settings.bullet_speed
         self.rect.x = self.x
-        
-    def draw_bullet(self):
-        """Draw the bullet image to the screen."""
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
+        if self.rect.x >= self._death_x:
+            self.kill()
@@ -8,6 +8,7 @@ Purpose: Provide a simple `Button` class used for the Play button on the
 game's title screen.
 """
 
+import pygame
 import pygame.font
 from typing import TYPE_CHECKING
 
@@ -33,6 +34,7 @@ class Button:
         self.rect = pygame.Rect(0,0,self.settings.button_w, self.settings.button_h)
         self.rect.center = self.boundaries.center
         self._prep_msg(msg)
+        self._prep_image()
 
     def _prep_msg(self, msg):
         """Render the button's message to an image and center it in the button."""
@@ -40,10 +42,15 @@ class Button:
         self.msg_image_rect = self.msg_image.get_rect()
         self.msg_image_rect.center = self.rect.center
 
+    def _prep_image(self):
+        """Pre-render the filled button with its message into one surface."""
+        self.image = pygame.Surface(self.rect.size).convert()
+        self.image.fill(self.settings.button_color)
+        self.image.blit(self.msg_image, self.msg_image_rect.move(-self.rect.x, -self.rect.y))
+
     def draw(self):
-        """Draw the button rectangle and its text to the screen."""
-        self.screen.fill(self.settings.button_color, self.rect)
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+        """Draw the pre-rendered button and return the screen area it covers."""
+        return self.screen.blit(self.image, self.rect)
 
     def check_clicked(self, mouse_pos):
         """Return True if `mouse_pos` lies within the button rect."""
@@ -33,7 +33,7 @@ class GameStats:
     def init_saved_scores(self):
         """Load saved hi-score from disk or create defaults if missing."""
         self.path = self.settings.scores_file
-        if  self.path.exists() and self.path.stat.__sizeof__() > 20:
+        if self.path.exists() and self.path.stat().st_size > 20:
             contents = self.path.read_text()
             scores = json.loads(contents)
             self.hi_score = scores.get('hi_score', 0)
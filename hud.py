@@ -29,6 +29,7 @@ class HUD:
         self.font = pygame.font.Font(self.settings.font_file,
             self.settings.HUD_font_size)
         self.padding = 20
+        self.drawn_rects = []
         self.update_scores()
         self._setup_life_image()
         self.update_level()
@@ -38,7 +39,7 @@ class HUD:
         self.life_image = pygame.image.load(self.settings.ship_file)
         self.life_image = pygame.transform.scale(self.life_image, (
             self.settings.ship_w, self.settings.ship_h
-        ))
+        )).convert_alpha()
         self.life_rect = self.life_image.get_rect()
 
     def update_scores(self):
@@ -83,17 +84,34 @@ class HUD:
         self.level_rect.top = self.life_rect.bottom + self.padding
 
     def _draw_lives(self):
-        """Draw remaining ship icons to represent lives left."""
+        """Draw remaining ship icons to represent lives left.
+
+        Returns the screen areas covered by the icons.
+        """
         current_x = self.padding
         current_y = self.padding
+        drawn = []
         for _ in range(self.game_stats.ships_left):
-            self.screen.blit(self.life_image, (current_x, current_y))
+            drawn.append(self.screen.blit(self.life_image, (current_x, current_y)))
             current_x += self.life_rect.width + self.padding
+        return drawn
+
+    def clear(self, bg):
+        """Erase the HUD as drawn last frame by blitting `bg` over it."""
+        for rect in self.drawn_rects:
+            self.screen.blit(bg, rect, rect)
 
     def draw(self):
-        """Blit all HUD images onto the screen surface."""
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self._draw_lives()
+        """Blit all HUD images onto the screen surface.
+
+        Returns the screen areas drawn this frame and last frame.
+        """
+        dirty = self.drawn_rects
+        self.drawn_rects = [
+            self.screen.blit(self.hi_score_image, self.hi_score_rect),
+            self.screen.blit(self.max_score_image, self.max_score_rect),
+            self.screen.blit(self.score_image, self.score_rect),
+            self.screen.blit(self.level_image, self.level_rect),
+        ]
+        self.drawn_rects += self._draw_lives()
+        return dirty + self.drawn_rects
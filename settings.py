@@ -11,6 +11,8 @@ initialize and scale dynamic values as difficulty increases.
 
 from pathlib import Path
 
+ASSETS_DIR = Path(__file__).resolve().parent / 'Assets'
+
 
 class Settings:
     """Container for game settings and configuration.
@@ -25,24 +27,29 @@ class Settings:
         self.screen_w = 1200
         self.screen_h = 800
         self.FPS = 60
-        self.bg_file = Path.cwd() / 'Assets' / 'images' / 'Starbasesnow.png'
+        self.bg_file = ASSETS_DIR / 'images' / 'Starbasesnow.png'
         self.difficulty_scale = 1.1
-        self.scores_file = Path.cwd() / 'Assets' / 'file' / 'scores.json'
+        self.scores_file = ASSETS_DIR / 'file' / 'scores.json'
 
-        self.ship_file = Path.cwd() / 'Assets' / 'images' / 'ship2(no bg).png'
+        self.ship_file = ASSETS_DIR / 'images' / 'ship2(no bg).png'
         self.ship_w = 40
         self.ship_h = 60
         
 
-        self.bullet_file = Path.cwd() / 'Assets' / 'images' / 'laserBlast.png'
-        self.laser_sound = Path.cwd() / 'Assets' / 'sound' / 'laser.mp3'
-        self.impact_sound = Path.cwd() / 'Assets' / 'sound' / 'impactSound.mp3'
+        self.bullet_file = ASSETS_DIR / 'images' / 'laserBlast.png'
+        self.laser_sound = ASSETS_DIR / 'sound' / 'laser.mp3'
+        self.impact_sound = ASSETS_DIR / 'sound' / 'impactSound.mp3'
         
-        self.alien_file = Path.cwd() / 'Assets' / 'images' / 'enemy_4.png'
+        self.alien_file = ASSETS_DIR / 'images' / 'enemy_4.png'
         self.alien_w = 40
         self.alien_h = 40
         self.fleet_direction = 1
 
+        # Shared, pre-converted sprite images; loaded on first use once the
+        # display mode is set.
+        self.alien_surface = None
+        self.bullet_surface = None
+
         self.button_w = 200
         self.button_h = 50
         self.button_color = (0,135,50)
@@ -50,7 +57,7 @@ class Settings:
         self.text_color = (255,255,255)
         self.button_font_size = 48
         self.HUD_font_size = 20
-        self.font_file = Path.cwd() / 'Assets' / 'Fonts' / 'Silkscreen' / 'Silkscreen-Bold.ttf'
+        self.font_file = ASSETS_DIR / 'Fonts' / 'Silkscreen' / 'Silkscreen-Bold.ttf'
 
     def initialize_dynamic_settings(self):
         """Initialize settings that may change throughout the game.
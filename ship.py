@@ -26,7 +26,7 @@ class Ship:
         screen: Pygame display surface.
         boundaries: Screen rectangle for boundary checks.
         image, rect: Pygame image and rect for the ship sprite.
-        moving_up/moving_down: Movement flags.
+        drawn_rect: Screen area the ship was last drawn to, if any.
         arsenal: Arsenal instance used to fire bullets.
     """
     def __init__(self, game: 'AlienInvasion', arsenal: 'Arsenal'):
@@ -34,7 +34,7 @@ class Ship:
         Initialize the ship.
 
         Loads the ship image, scales and rotates it, centers the ship, and
-        initializes movement flags and the linked `Arsenal`.
+        stores the linked `Arsenal`.
         """
         self.game = game
         self.settings = game.settings
@@ -43,12 +43,11 @@ class Ship:
 
         self.image = pygame.image.load(self.settings.ship_file)
         self.image = pygame.transform.scale(self.image, (self.settings.ship_w, self.settings.ship_h))
-        self.image = pygame.transform.rotate(self.image, -90)
+        self.image = pygame.transform.rotate(self.image, -90).convert_alpha()
 
         self.rect = self.image.get_rect()
         self._center_ship()
-        self.moving_up = False
-        self.moving_down = False
+        self.drawn_rect = None
         self.arsenal = arsenal
         
     def _center_ship(self):
@@ -56,25 +55,41 @@ class Ship:
         self.rect.midleft = self.boundaries.midleft
         self.y = float(self.rect.y)
 
-    def update(self):
-        """Update ship position and its arsenal each frame."""
-        self._update_ship_movement()
+    def update(self, keys):
+        """Update ship position and its arsenal each frame.
+
+        Args:
+            keys: Keyboard state from `pygame.key.get_pressed()` for this frame.
+        """
+        self._update_ship_movement(keys)
         self.arsenal.update_arsenal()
 
-    def _update_ship_movement(self):
-        """Apply movement flags to the ship's vertical position."""
+    def _update_ship_movement(self, keys):
+        """Move the ship vertically while the UP/DOWN arrow keys are held."""
         temp_speed = self.settings.ship_speed
-        if self.moving_up and self.rect.top > self.boundaries.top:
+        if keys[pygame.K_UP] and self.rect.top > self.boundaries.top:
             self.y -= temp_speed
-        if self.moving_down and self.rect.bottom < self.boundaries.bottom:
+        if keys[pygame.K_DOWN] and self.rect.bottom < self.boundaries.bottom:
             self.y += temp_speed
         
         self.rect.y = self.y
 
+    def clear(self, bg):
+        """Erase the ship and its arsenal as drawn last frame using `bg`."""
+        self.arsenal.clear(bg)
+        if self.drawn_rect:
+            self.screen.blit(bg, self.drawn_rect, self.drawn_rect)
+
     def draw(self):
-        """Draw the ship and its arsenal to the screen."""
-        self.arsenal.draw()
+        """Draw the ship and its arsenal and return the changed screen areas."""
+        dirty = self.arsenal.draw()
         self.screen.blit(self.image, self.rect)
+        if self.drawn_rect:
+            dirty.append(self.drawn_rect.union(self.rect))
+        else:
+            dirty.append(self.rect.copy())
+        self.drawn_rect = self.rect.copy()
+        return dirty
 
     def fire(self):
         """Fire a bullet via the associated `Arsenal`.
@@ -88,8 +103,10 @@ class Ship:
 
         If a collision occurs, the ship is re-centered and True is returned.
         """
-        if pygame.sprite.spritecollideany(self, other_group):
-            self._center_ship()
-            return True
+        ship_rect = self.rect
+        for sprite in other_group:
+            if ship_rect.colliderect(sprite.rect):
+                self._center_ship()
+                return True
         return False
     
\ No newline at end of file